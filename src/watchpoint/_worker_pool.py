@@ -0,0 +1,106 @@
+"""
+A pool of parked daemon threads that run Watchpoint monitoring loops.
+
+Starting a watchpoint hands its loop to an idle worker instead of creating a
+new thread, so repeatedly starting and stopping a watchpoint (e.g. with a
+`with` block) does not pay for thread creation every time.
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Workers beyond this many idle ones exit instead of parking.
+_MAX_IDLE_WORKERS = 8
+
+_idle: List["_Worker"] = []
+_idle_lock = threading.Lock()
+
+
+class Task:
+    """
+    A handle for a function running on a pooled worker.
+
+    It mirrors the subset of the `threading.Thread` API used by Watchpoint:
+    `is_alive()` is `True` until the function returns, and `join()` waits for
+    that, regardless of the worker thread itself staying alive.
+    """
+
+    def __init__(self, target: Callable[[], None]):
+        self._target = target
+        self._done = threading.Event()
+
+    def is_alive(self) -> bool:
+        return not self._done.is_set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._done.wait(timeout)
+
+
+class _Worker(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True, name="WatchpointThread")
+        self._kick = threading.Event()
+        self._task: Optional[Task] = None
+
+    def assign(self, task: Task) -> None:
+        self._task = task
+        self._kick.set()
+
+    def run(self) -> None:
+        while True:
+            self._kick.wait()
+            self._kick.clear()
+            task, self._task = self._task, None
+            if task is None:
+                continue
+            try:
+                task._target()
+            except Exception:
+                logger.exception("Unhandled error in Watchpoint thread.")
+            except BaseException:
+                # e.g. SystemExit: let this thread end as a plain thread would,
+                # without returning it to the pool.
+                task._done.set()
+                raise
+            parked = _park(self)
+            task._done.set()
+            if not parked:
+                return
+
+
+def _park(worker: _Worker) -> bool:
+    """Returns `worker` to the idle list. Returns `False` if the list is full."""
+    with _idle_lock:
+        if len(_idle) >= _MAX_IDLE_WORKERS:
+            return False
+        _idle.append(worker)
+        return True
+
+
+def _reset_after_fork() -> None:
+    """Drops the parent's workers, whose threads do not exist in a forked child."""
+    global _idle, _idle_lock
+    _idle = []
+    _idle_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def submit(target: Callable[[], None]) -> Task:
+    """Runs `target` on an idle worker, starting a new one if none is parked."""
+    task = Task(target)
+    with _idle_lock:
+        worker = _idle.pop() if _idle else None
+    if worker is None:
+        worker = _Worker()
+        worker.assign(task)
+        worker.start()
+    else:
+        worker.assign(task)
+    return task
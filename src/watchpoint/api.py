@@ -1,5 +1,6 @@
 from typing import Callable, Generator, Union
 
+from watchpoint.conditions import Condition
 from watchpoint.core import Watchpoint
 
 
@@ -42,7 +43,7 @@ def on(func: Callable, /, *args, **kwargs) -> Watchpoint:
 
 def watch(
     *,
-    on_handler: Callable[[], Union[bool, Generator[bool, None, None]]],
+    on_handler: Callable[[], Union[bool, Generator[bool, None, None], Condition]],
     do_handler: Callable[[], None],
 ) -> Watchpoint:
     """
@@ -6,17 +6,510 @@ the `on()` or `watch()` Watchpoint factories. They cover common use cases like
 time-based triggers, file system monitoring, and network checks.
 
 Generator-based handlers are designed for continuous monitoring and gracefully
-handle shutdown by accepting a `stop_event`.
+handle shutdown by accepting a `stop_event`. Each of them is a thin adapter
+around a `Condition` class (e.g. `every_n_seconds` and `EveryNSeconds`), which
+can be passed to `on()` instead to skip the generator machinery.
+
+The file system conditions run their periodic checks on one shared background
+thread, so a slow check (or `predicate`) delays the others.
 """
 
+import ctypes
+import errno
+import heapq
+import itertools
+import logging
+import math
 import os
+import select
 import socket
+import struct
+import sys
+import threading
 import time
+from abc import ABC, abstractmethod
 from pathlib import Path
 from threading import Event
-from typing import Generator, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+# --- inotify (Linux) ---
+
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+_IS_WINDOWS = sys.platform == "win32"
+
+_libc: Optional[ctypes.CDLL] = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+    except (OSError, AttributeError):
+        _libc = None
+
+
+def _inotify_watch(directory_path: Union[str, os.PathLike], mask: int) -> Optional[int]:
+    """
+    Opens a non-blocking inotify instance watching `directory_path` for `mask`.
+
+    Returns:
+        The inotify file descriptor, or `None` if inotify is unavailable, in
+        which case callers should fall back to polling.
+    """
+    if _libc is None:
+        return None
+    fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    if _libc.inotify_add_watch(fd, os.fsencode(directory_path), mask) < 0:
+        err = ctypes.get_errno()
+        os.close(fd)
+        if err == errno.ENOENT:
+            raise FileNotFoundError(f"Directory not found at: {directory_path}")
+        return None
+    return fd
+
+
+def _inotify_drain(fd: int, mask: int) -> Tuple[Set[str], bool]:
+    """
+    Reads all pending events from `fd`.
+
+    Returns:
+        The names of the entries whose events matched `mask`, and whether the
+        kernel's event queue overflowed (in which case events were lost).
+    """
+    names: Set[str] = set()
+    overflowed = False
+    while True:
+        try:
+            buf = os.read(fd, 4096)
+        except BlockingIOError:
+            return names, overflowed
+        if not buf:
+            return names, overflowed
+        offset = 0
+        while offset < len(buf):
+            _, event_mask, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+            offset += _INOTIFY_EVENT.size
+            if event_mask & _IN_Q_OVERFLOW:
+                overflowed = True
+            elif event_mask & mask:
+                name = buf[offset : offset + name_len].rstrip(b"\0")
+                names.add(os.fsdecode(name))
+            offset += name_len
+
+
+# --- stat() cache ---
+
+# Maps `os.fspath(path)` to `(checked_at, st_mtime_ns, st_size, exists)`, where
+# `checked_at` is a `time.monotonic()` timestamp. Missing files are cached too.
+_stat_cache: Dict[str, Tuple[float, int, int, bool]] = {}
+
+
+def _cached_stat(path: str, ttl: float) -> Tuple[int, int, bool]:
+    """
+    Returns `(st_mtime_ns, st_size, exists)` for `path`, reusing a previous
+    result if it is younger than `ttl` seconds.
+    """
+    now = time.monotonic()
+    entry = _stat_cache.get(path)
+    if entry is None or now - entry[0] >= ttl:
+        try:
+            st = os.stat(path)
+            entry = (now, st.st_mtime_ns, st.st_size, True)
+        except (FileNotFoundError, NotADirectoryError):
+            entry = (now, 0, 0, False)
+        _stat_cache[path] = entry
+    return entry[1], entry[2], entry[3]
 
-# --- Time-Based Conditions (Generators) ---
+
+def clear_stat_cache(path: Optional[Union[str, os.PathLike]] = None) -> None:
+    """
+    Discards cached `stat()` results used by the file system conditions.
+
+    Args:
+        path: Only forget the result for this path. If `None`, the whole cache
+              is cleared.
+    """
+    if path is None:
+        _stat_cache.clear()
+    else:
+        _stat_cache.pop(os.fspath(path), None)
+
+
+# --- Shared poller ---
+
+
+class _PendingCheck:
+    """
+    A check submitted to the `_Poller`, and the slot for its result.
+
+    A check is either cancelled before the poller starts it, or started and
+    then run to completion; the two are decided under `_lock`, so a caller
+    that gave up never has its check start afterwards.
+    """
+
+    __slots__ = (
+        "check",
+        "stop_event",
+        "done",
+        "result",
+        "_lock",
+        "_started",
+        "_cancelled",
+        "_callbacks",
+    )
+
+    def __init__(self, check: Callable[[], Any], stop_event: Event):
+        self.check = check
+        self.stop_event = stop_event
+        self.done = Event()
+        self.result: Any = None
+        self._lock = threading.Lock()
+        self._started = False
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+
+    def cancel(self) -> bool:
+        """Cancels the check unless it has started. Returns whether it did."""
+        with self._lock:
+            if self._started:
+                return False
+            self._cancelled = True
+        self.done.set()
+        return True
+
+    def start(self) -> bool:
+        """Marks the check as running. Returns `False` if it should be skipped."""
+        with self._lock:
+            if self._cancelled or self.stop_event.is_set():
+                self._cancelled = True
+            else:
+                self._started = True
+        if not self._started:
+            self.done.set()
+        return self._started
+
+    def finish(self, result: Any) -> None:
+        """Stores the result and runs the callbacks registered with `then()`."""
+        with self._lock:
+            self.result = result
+            self.done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error releasing a file system condition.")
+
+    def then(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the check is no longer running."""
+        with self._lock:
+            if self._started and not self.done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class _Poller:
+    """
+    A single daemon thread that runs the periodic checks of the file system
+    conditions.
+
+    Each condition submits one check at a time together with a delay. The
+    poller keeps pending checks in a min-heap ordered by deadline and sleeps
+    until the earliest one, so checks that fall due together can share cached
+    `stat()` results.
+
+    Checks run one after another on this thread, so a slow check (e.g. a
+    `stat()` on an unresponsive network mount, or a slow `predicate` passed to
+    `new_file_in_directory`) delays every other file system condition in the
+    process.
+    """
+
+    # How often a caller whose check is running looks at its stop_event.
+    _STOP_CHECK_SECONDS = 0.05
+
+    _instance: Optional["_Poller"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "_Poller":
+        """Returns the process-wide poller, starting its thread on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The poller thread does not exist in a forked child; start a new one
+        # on first use there.
+        cls._instance = None
+        cls._instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, _PendingCheck]] = []
+        self._counter = itertools.count()
+        self._thread = threading.Thread(
+            target=self._loop, daemon=True, name="WatchpointPoller"
+        )
+        self._thread.start()
+
+    def submit(
+        self, check: Callable[[], Any], delay: float, stop_event: Event
+    ) -> _PendingCheck:
+        """Schedules `check` to run on the poller thread after `delay` seconds."""
+        pending = _PendingCheck(check, stop_event)
+        deadline = time.monotonic() + delay
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), pending))
+            self._cond.notify()
+        return pending
+
+    @classmethod
+    def wait(cls, pending: _PendingCheck, delay: float) -> Optional[Any]:
+        """
+        Waits for the result of a check submitted with `submit()`.
+
+        Returns `None` as soon as the check's `stop_event` is set; a check that
+        has not started by then is cancelled. Exceptions raised by the check
+        are re-raised in the caller.
+        """
+        stop_event = pending.stop_event
+        # Sleep on the caller's own stop_event so that stopping is immediate.
+        if stop_event.wait(delay):
+            pending.cancel()
+            return None
+        while not pending.done.wait(cls._STOP_CHECK_SECONDS):
+            if stop_event.is_set():
+                pending.cancel()
+                return None
+        if isinstance(pending.result, BaseException):
+            raise pending.result
+        return pending.result
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                due = self._wait_for_due()
+            for pending in due:
+                if not pending.start():
+                    continue
+                try:
+                    result = pending.check()
+                except BaseException as e:
+                    # Hand anything, even SystemExit from a user predicate, to
+                    # the caller; this thread is shared by every condition.
+                    result = e
+                pending.finish(result)
+
+    def _wait_for_due(self) -> List[_PendingCheck]:
+        """Blocks until at least one check is due and pops all due checks."""
+        while True:
+            if not self._heap:
+                self._cond.wait()
+                continue
+
+            now = time.monotonic()
+            if self._heap[0][0] > now:
+                self._cond.wait(self._heap[0][0] - now)
+                continue
+
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[2])
+            return due
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_Poller._reset_after_fork)
+
+
+# --- Non-blocking TCP connect ---
+
+_CONNECT_IN_PROGRESS = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+}
+
+
+def _connect_nonblocking(
+    host: str, port: int, timeout: float
+) -> Optional[socket.socket]:
+    """
+    Opens a TCP connection, waiting at most `timeout` seconds for the handshake.
+
+    Returns:
+        The connected non-blocking socket, or `None` if the connection failed.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    connected = False
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex((host, port))
+        if err in _CONNECT_IN_PROGRESS and _wait_writable(sock, timeout):
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        connected = err == 0
+    finally:
+        if not connected:
+            sock.close()
+    return sock if connected else None
+
+
+def _wait_writable(sock: socket.socket, timeout: float) -> bool:
+    """Waits up to `timeout` seconds for a connecting socket to settle."""
+    if hasattr(select, "poll"):
+        # poll() has no FD_SETSIZE limit on descriptor numbers, unlike select().
+        poller = select.poll()
+        poller.register(sock, select.POLLOUT)
+        return bool(poller.poll(timeout * 1000))
+    # Windows has no poll() and reports a failed connect through the
+    # exceptional set.
+    _, writable, failed = select.select([], [sock], [sock], timeout)
+    return bool(writable or failed)
+
+
+# Unanswered keepalive probes after which a held connection is dropped.
+_KEEPALIVE_PROBES = 3
+
+
+def _enable_keepalive(sock: socket.socket, idle: float, interval: float) -> None:
+    """
+    Turns on TCP keepalive for a held connection, so a peer that vanished
+    without closing it is noticed.
+
+    Where the platform supports it, the first probe is sent after `idle`
+    seconds without traffic and repeated every `interval` seconds, so a dead
+    peer is detected after roughly `idle + _KEEPALIVE_PROBES * interval`
+    seconds. Elsewhere the OS defaults apply (about 2 hours 11 minutes on
+    Linux).
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # macOS calls the idle time option TCP_KEEPALIVE.
+    idle_option = getattr(
+        socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+    )
+    for option, value in (
+        (idle_option, idle),
+        (getattr(socket, "TCP_KEEPINTVL", None), interval),
+        (getattr(socket, "TCP_KEEPCNT", None), _KEEPALIVE_PROBES),
+    ):
+        if option is None:
+            continue
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, option, max(1, math.ceil(value)))
+        except OSError:
+            # Not supported by this kernel; keep the OS default.
+            pass
+
+
+# --- Condition Protocol ---
+
+
+class Condition(ABC):
+    """
+    A stateful condition that a Watchpoint polls directly.
+
+    `poll()` blocks until the next check is due and returns its result, or
+    `None` once the condition is finished (e.g. because the `stop_event` was
+    set). When an 'on' handler returns a `Condition`, the Watchpoint calls
+    `poll()` in a loop instead of resuming a generator, and calls `close()`
+    when it is done. The generator functions in this module are thin adapters
+    around these classes.
+    """
+
+    @abstractmethod
+    def poll(self) -> Optional[bool]:
+        """Waits for the next check and returns its result, or `None` when done."""
+
+    def close(self) -> None:
+        """Releases any resources held by the condition. Safe to call repeatedly."""
+
+
+class _PolledCondition(Condition):
+    """
+    A `Condition` whose checks run on the shared `_Poller` thread.
+
+    Subclasses release their resources in `_release()`, which `close()` defers
+    until any check still running on the poller thread has finished.
+    """
+
+    def __init__(self, stop_event: Event, interval: float, first_delay: float = 0.0):
+        self._stop_event = stop_event
+        self._interval = interval
+        self._delay = first_delay
+        self._pending: Optional[_PendingCheck] = None
+
+    def poll(self) -> Optional[bool]:
+        if self._stop_event.is_set():
+            return None
+        self._pending = _Poller.instance().submit(
+            self._check, self._delay, self._stop_event
+        )
+        result = _Poller.wait(self._pending, self._delay)
+        self._delay = self._interval
+        return result
+
+    def close(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            self._release()
+        else:
+            pending.then(self._release)
+
+    @abstractmethod
+    def _check(self) -> bool:
+        """Runs one check on the poller thread and returns its result."""
+
+    def _release(self) -> None:
+        """Releases resources used by `_check()`. Safe to call repeatedly."""
+
+
+def _iterate(condition: Condition) -> Generator[bool, None, None]:
+    """Yields the results of `condition.poll()` and closes it when done."""
+    try:
+        while (result := condition.poll()) is not None:
+            yield result
+    finally:
+        condition.close()
+
+
+# --- Time-Based Conditions ---
+
+
+class EveryNSeconds(Condition):
+    """`Condition` form of `every_n_seconds()`."""
+
+    def __init__(self, seconds: float, stop_event: Event):
+        self._seconds = seconds
+        self._stop_event = stop_event
+
+    def poll(self) -> Optional[bool]:
+        # wait() returns True as soon as the event is set, False on timeout.
+        return None if self._stop_event.wait(self._seconds) else True
 
 
 def every_n_seconds(seconds: float, stop_event: Event) -> Generator[bool, None, None]:
@@ -34,52 +527,150 @@ def every_n_seconds(seconds: float, stop_event: Event) -> Generator[bool, None,
     Yields:
         `True` after each interval.
     """
-    while not stop_event.is_set():
-        # wait() returns True if the event was set, False on timeout.
-        # We want to continue on timeout, so we check the event again.
-        stop_event.wait(seconds)
-        if not stop_event.is_set():
-            yield True
+    yield from _iterate(EveryNSeconds(seconds, stop_event))
 
 
 # --- File System Conditions ---
+
+
+class NewFileInDirectory(_PolledCondition):
+    """`Condition` form of `new_file_in_directory()`."""
+
+    def __init__(
+        self,
+        directory_path: os.PathLike,
+        stop_event: Event,
+        check_interval_seconds: float = 5.0,
+        predicate: Optional[Callable[[os.DirEntry], bool]] = None,
+    ):
+        p = Path(directory_path)
+        if not p.is_dir():
+            raise FileNotFoundError(f"Directory not found at: {directory_path}")
+        super().__init__(
+            stop_event, check_interval_seconds, first_delay=check_interval_seconds
+        )
+        self._path = os.fspath(p)
+        self._predicate = predicate
+        self._fd = _inotify_watch(p, _IN_CREATE | _IN_MOVED_TO)
+        self._known_entries: FrozenSet[Tuple[str, int]] = frozenset()
+        if self._fd is None:
+            self._known_entries = self._scan()
+
+    def _scan(self) -> FrozenSet[Tuple[str, int]]:
+        # A (name, inode) pair catches both a new name and a file replaced
+        # under an existing name, even when the filesystem reuses inode
+        # numbers. On Windows `DirEntry.inode()` costs a system call per entry,
+        # so only names are compared there.
+        predicate = self._predicate
+        with os.scandir(self._path) as entries:
+            return frozenset(
+                (e.name, 0 if _IS_WINDOWS else e.inode())
+                for e in entries
+                if predicate is None or predicate(e)
+            )
+
+    def _check(self) -> bool:
+        if self._fd is None:
+            current_entries = self._scan()
+            new_entries = current_entries - self._known_entries
+            self._known_entries = current_entries
+            return bool(new_entries)
+
+        names, overflowed = _inotify_drain(self._fd, _IN_CREATE | _IN_MOVED_TO)
+        if self._predicate is None or overflowed:
+            return overflowed or bool(names)
+        if not names:
+            return False
+        with os.scandir(self._path) as entries:
+            return any(e.name in names and self._predicate(e) for e in entries)
+
+    def _release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
 def new_file_in_directory(
     directory_path: os.PathLike,
     stop_event: Event,
     check_interval_seconds: float = 5.0,
+    predicate: Optional[Callable[[os.DirEntry], bool]] = None,
 ) -> Generator[bool, None, None]:
     """
     Yields `True` whenever a new file is detected in a directory.
 
-    This generator maintains a state of known files and triggers when the
-    set of files in the directory changes. It's ideal for "dropbox" style
-    monitoring where an action should be taken on newly arrived files.
+    This generator triggers when files are created in or moved into the
+    directory. It's ideal for "dropbox" style monitoring where an action
+    should be taken on newly arrived files.
+
+    On Linux the directory is watched with inotify, so each check only drains
+    the events the kernel has queued instead of re-listing the directory. On
+    other platforms, or if inotify is unavailable, it falls back to comparing
+    the names and inode numbers reported by `os.scandir()`.
 
     Args:
         directory_path: The absolute path to the directory to watch.
         stop_event: A threading.Event provided by the Watchpoint to signal shutdown.
         check_interval_seconds: The time to wait between checking the directory.
+        predicate: Optional filter called with the `os.DirEntry` of each
+                   candidate; only entries for which it returns `True` count as
+                   new files. `DirEntry.is_file()` and `is_dir()` usually answer
+                   without an extra system call. It runs on the thread shared
+                   by all file system conditions, so it should be fast.
 
     Yields:
         `True` when one or more new files are found, otherwise `False`.
     """
-    p = Path(directory_path)
-    if not p.is_dir():
-        raise FileNotFoundError(f"Directory not found at: {directory_path}")
+    yield from _iterate(
+        NewFileInDirectory(
+            directory_path, stop_event, check_interval_seconds, predicate
+        )
+    )
 
-    known_files = set(p.iterdir())
-    while not stop_event.is_set():
-        if stop_event.wait(check_interval_seconds):
-            # Stop event was set during wait
-            break
 
-        current_files = set(p.iterdir())
-        if current_files - known_files:  # Check for any new files
-            yield True
-        else:
-            yield False
+class _StatCondition(_PolledCondition):
+    """
+    A `_PolledCondition` that checks a path with `_cached_stat()`.
+
+    The path is resolved to a string once, and every check stats the full
+    path, so it always sees whatever is currently at that name.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, os.PathLike],
+        stop_event: Event,
+        check_interval_seconds: float,
+    ):
+        super().__init__(stop_event, check_interval_seconds)
+        self._path = os.fspath(file_path)
+        self._ttl = check_interval_seconds / 2
+
+    def _stat(self) -> Tuple[int, int, bool]:
+        return _cached_stat(self._path, self._ttl)
+
+    def _release(self) -> None:
+        clear_stat_cache(self._path)
+
+
+class FileNotModifiedFor(_StatCondition):
+    """`Condition` form of `file_not_modified_for()`."""
 
-        known_files = current_files
+    def __init__(
+        self,
+        file_path: Union[str, os.PathLike],
+        stop_event: Event,
+        duration_seconds: float = 300.0,
+        check_interval_seconds: float = 60.0,
+    ):
+        super().__init__(file_path, stop_event, check_interval_seconds)
+        self._duration_ns = duration_seconds * 1e9
+
+    def _check(self) -> bool:
+        mtime_ns, _, exists = self._stat()
+        # A non-existent file is not considered "unmodified" in this context.
+        # It simply doesn't exist to be checked. We yield False.
+        return exists and (time.time_ns() - mtime_ns) > self._duration_ns
 
 
 def file_not_modified_for(
@@ -95,6 +686,9 @@ def file_not_modified_for(
     interval (`check_interval_seconds`), it checks if the file's last
     modification time is older than the specified `duration_seconds`.
 
+    `stat()` results are shared with other conditions watching the same path
+    for up to half of `check_interval_seconds`; see `clear_stat_cache()`.
+
     Args:
         file_path: The path to the file to monitor.
         stop_event: A threading.Event provided by the Watchpoint to signal shutdown.
@@ -105,25 +699,26 @@ def file_not_modified_for(
         `True` if the file has not been modified for the specified duration,
         otherwise `False`.
     """
-    path_to_check = Path(file_path)
+    yield from _iterate(
+        FileNotModifiedFor(
+            file_path, stop_event, duration_seconds, check_interval_seconds
+        )
+    )
 
-    while not stop_event.is_set():
-        is_unmodified = False
-        try:
-            last_modified_time = path_to_check.stat().st_mtime
-            current_time = time.time()
-            if (current_time - last_modified_time) > duration_seconds:
-                is_unmodified = True
-        except FileNotFoundError:
-            # A non-existent file is not considered "unmodified" in this context.
-            # It simply doesn't exist to be checked. We yield False.
-            pass
 
-        yield is_unmodified
+class FileExists(_StatCondition):
+    """`Condition` form of `file_exists()`."""
+
+    def __init__(
+        self,
+        file_path: Union[str, os.PathLike],
+        stop_event: Event,
+        check_interval_seconds: float = 2.0,
+    ):
+        super().__init__(file_path, stop_event, check_interval_seconds)
 
-        # Wait for the next check interval in an interruptible way
-        if stop_event.wait(check_interval_seconds):
-            break
+    def _check(self) -> bool:
+        return self._stat()[2]
 
 
 def file_exists(
@@ -138,6 +733,10 @@ def file_exists(
     It is ideal for waiting for a file to be created or for monitoring that
     a file remains in place.
 
+    `stat()` results, including "not found", are shared with other conditions
+    watching the same path for up to half of `check_interval_seconds`; see
+    `clear_stat_cache()`.
+
     Args:
         file_path: The path to the file or directory to check.
         stop_event: A threading.Event provided by the Watchpoint to signal shutdown.
@@ -146,17 +745,72 @@ def file_exists(
     Yields:
         `True` if the path exists during a check, otherwise `False`.
     """
-    path_to_check = Path(file_path)
+    yield from _iterate(FileExists(file_path, stop_event, check_interval_seconds))
 
-    while not stop_event.is_set():
-        yield path_to_check.exists()
 
-        # Wait for the next check, breaking early if the stop event is set.
-        if stop_event.wait(check_interval_seconds):
-            break
+# --- Network Conditions ---
 
 
-# --- Network Conditions ---
+class IsPortOpen(Condition):
+    """`Condition` form of `is_port_open()`."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        stop_event: Event,
+        check_interval_seconds: float = 5.0,
+        timeout: float = 2.0,
+        reuse_connection: bool = False,
+    ):
+        self._host = host
+        self._port = port
+        self._stop_event = stop_event
+        self._interval = check_interval_seconds
+        self._timeout = timeout
+        self._reuse_connection = reuse_connection
+        self._sock: Optional[socket.socket] = None
+        self._checked = False
+
+    def poll(self) -> Optional[bool]:
+        if self._stop_event.is_set():
+            return None
+        # Wait for the next check interval.
+        if self._checked and self._stop_event.wait(self._interval):
+            return None
+        self._checked = True
+        return self._probe()
+
+    def _probe(self) -> bool:
+        if self._sock is not None:
+            try:
+                # Discard anything the server sent (e.g. a greeting banner);
+                # unread data would otherwise hide an end-of-file behind it.
+                while self._sock.recv(4096):
+                    pass
+            except BlockingIOError:
+                # Nothing more to read, but the connection is still up.
+                return True
+            except OSError:
+                pass
+            # The peer closed this connection. That does not mean the listener
+            # is gone, so fall through to a fresh connect.
+            self.close()
+
+        sock = _connect_nonblocking(self._host, self._port, self._timeout)
+        if sock is None:
+            return False
+        if self._reuse_connection:
+            _enable_keepalive(sock, self._interval, self._timeout)
+            self._sock = sock
+        else:
+            sock.close()
+        return True
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
 
 
 def is_port_open(
@@ -165,6 +819,7 @@ def is_port_open(
     stop_event: Event,
     check_interval_seconds: float = 5.0,
     timeout: float = 2.0,
+    reuse_connection: bool = False,
 ) -> Generator[bool, None, None]:
     """
     Continuously checks if a TCP port is open, yielding the result.
@@ -172,24 +827,33 @@ def is_port_open(
     This generator monitors a network port at a regular interval. It's useful
     for waiting for a service to start or for monitoring its health.
 
+    With `reuse_connection`, the connection from a successful check is kept
+    open, and later checks only read from it (discarding any data the service
+    sends) without sending any packets. A new connection is made only after
+    the peer closes or resets it. Note that this
+    occupies one of the service's connections while the port is open.
+
+    A held connection relies on TCP keepalive to notice a host that went away
+    without closing it (e.g. a crash or a network outage). Where the platform
+    allows it (Linux, macOS, recent Windows), keepalive probes start after
+    `check_interval_seconds` of silence and are repeated every `timeout`
+    seconds, so such an outage is reported after about
+    `check_interval_seconds + 3 * timeout`. Otherwise the OS defaults apply,
+    which on Linux take about 2 hours 11 minutes.
+
     Args:
         host: The hostname or IP address to check.
         port: The port number to check.
         stop_event: A threading.Event provided by the Watchpoint to signal shutdown.
         check_interval_seconds: The time in seconds to wait between each check.
         timeout: The connection timeout in seconds for each check.
+        reuse_connection: Keep the connection open between checks.
 
     Yields:
         `True` if the port is open during a check, otherwise `False`.
     """
-    while not stop_event.is_set():
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            # connect_ex returns 0 on success.
-            port_is_currently_open = s.connect_ex((host, port)) == 0
-
-        yield port_is_currently_open
-
-        # Wait for the next check interval.
-        if stop_event.wait(check_interval_seconds):
-            break
+    yield from _iterate(
+        IsPortOpen(
+            host, port, stop_event, check_interval_seconds, timeout, reuse_connection
+        )
+    )
@@ -1,32 +1,84 @@
 import inspect
+import keyword
 import logging
 import threading
-from functools import partial
-from typing import Callable, Generator, Optional, Union
+from collections import deque
+from functools import partial, update_wrapper
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from watchpoint import _worker_pool
+from watchpoint.conditions import Condition
 from watchpoint.exceptions import WatchpointConfigurationError, WatchpointQuit
 
 logger = logging.getLogger(__name__)
 
 
+def _bind_call(
+    func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Callable[[], Any]:
+    """
+    Returns a zero-argument callable equivalent to `partial(func, *args, **kwargs)`.
+
+    Bound arguments are compiled into a small trampoline as constant names, so
+    each call avoids the keyword dictionary merge done by `partial`. Falls back
+    to `partial` if a keyword cannot be written as a keyword argument.
+    """
+    if not args and not kwargs:
+        return func
+    if not all(
+        k.isidentifier() and not keyword.iskeyword(k) and k != "__debug__"
+        for k in kwargs
+    ):
+        return partial(func, *args, **kwargs)
+
+    namespace: Dict[str, Any] = {"_fn": func}
+    params = []
+    for i, arg in enumerate(args):
+        namespace[f"_a{i}"] = arg
+        params.append(f"_a{i}")
+    for i, (key, value) in enumerate(kwargs.items()):
+        namespace[f"_k{i}"] = value
+        params.append(f"{key}=_k{i}")
+    exec(f"def _call():\n    return _fn({', '.join(params)})", namespace)
+    # Copy the name and docstring for logging, but not `__wrapped__`, which
+    # would make `inspect.signature()` report the wrapped function's arguments.
+    call = update_wrapper(namespace["_call"], func, updated=())
+    del call.__wrapped__
+    return call
+
+
 class Watchpoint:
     """
     Executes an action in response to a condition.
-    It intelligently handles two types of 'on' handlers:
+    It intelligently handles three types of 'on' handlers:
     1.  One-Shot Function: Returns a truthy value. The Watchpoint runs 'do_handler' once and stops.
     2.  Generator Function: Yields to signal the condition is met, allowing for continuous monitoring.
+    3.  Condition: Returns a `conditions.Condition`, which is polled like a generator
+        but without the overhead of resuming a generator frame.
     """
 
     def __init__(
         self,
         on_handler: Optional[
-            Callable[[], Union[bool, Generator[bool, None, None]]]
+            Callable[[], Union[bool, Generator[bool, None, None], Condition]]
         ] = None,
         do_handler: Optional[Callable] = None,
     ):
         self._on_handler = on_handler
         self._do_handler = do_handler
-        self._thread: Optional[threading.Thread] = None
+        self._buffer_size: Optional[int] = None
+        self._validated = False
+        self._thread: Optional[_worker_pool.Task] = None
         self._stop_event = threading.Event()
 
     def __enter__(self) -> "Watchpoint":
@@ -66,6 +118,7 @@ class Watchpoint:
                 "Watchpoint 'on' handler has already been set."
             )
         self._on_handler = partial(func, *args, **kwargs)
+        self._validated = False
         return self
 
     def do(self, func: Callable, /, *args, **kwargs) -> "Watchpoint":
@@ -81,13 +134,35 @@ class Watchpoint:
             raise WatchpointConfigurationError(
                 "Watchpoint 'do' handler has already been set."
             )
-        self._do_handler = partial(func, *args, **kwargs)
+        self._do_handler = _bind_call(func, args, kwargs)
+        self._validated = False
+        return self
+
+    def buffered(self, size: int = 64) -> "Watchpoint":
+        """
+        Runs the 'do' handler on its own worker thread in generator mode.
+
+        Triggers yielded by the 'on' handler are queued and consumed by the
+        worker, so a slow 'do' handler does not hold up the condition checks.
+        At most `size` triggers are kept pending; when the queue is full the
+        oldest one is dropped. On stop, pending triggers are drained before the
+        watchpoint finishes. One-shot handlers are not affected.
+
+        Args:
+            size: The maximum number of pending triggers.
+        """
+        if size < 1:
+            raise WatchpointConfigurationError(
+                f"Watchpoint buffer size must be at least 1. Got {size} instead."
+            )
+        self._buffer_size = size
         return self
 
     def _run(self):
         """
         The core loop. It inspects the 'on' handler's return type to determine
-        whether to run in one-shot mode or continuous generator mode.
+        whether to run in one-shot mode, continuous generator mode, or
+        continuous mode polling a `Condition`.
         """
         try:
             if not self._on_handler or not self._do_handler:
@@ -110,16 +185,22 @@ class Watchpoint:
 
             # --- Smart Handler Logic ---
             try:
-                if isinstance(ret, Generator):
+                if isinstance(ret, Condition):
+                    # Condition Mode: Like generator mode, but polls the
+                    # condition object directly instead of resuming a frame.
+                    logger.debug(
+                        "Handler returned a Condition. Entering continuous mode."
+                    )
+                    try:
+                        self._dispatch_generator(iter(ret.poll, None))
+                    finally:
+                        ret.close()
+                elif isinstance(ret, Generator):
                     # Generator Mode: For continuous monitoring.
                     logger.debug(
                         "Handler returned a generator. Entering continuous mode."
                     )
-                    for result in ret:  # We iterate but don't use the yielded value.
-                        if self._stop_event.is_set():
-                            break
-                        if result:
-                            self._execute_do_handler()
+                    self._dispatch_generator(ret)
                 elif isinstance(ret, bool):
                     # One-Shot Mode: For simple, single checks.
                     logger.debug("Handler returned a value. Entering one-shot mode.")
@@ -127,10 +208,11 @@ class Watchpoint:
                         self._execute_do_handler()
                 else:
                     logger.error(
-                        f"Invalid return type from 'on' handler. Expected bool or generator. Got {type(ret)} instead."
+                        "Invalid return type from 'on' handler. Expected bool, generator or Condition. Got %s instead.",
+                        type(ret),
                     )
                     raise WatchpointConfigurationError(
-                        f"Invalid return type from 'on' handler. Expected bool or generator. Got {type(ret)} instead."
+                        f"Invalid return type from 'on' handler. Expected bool, generator or Condition. Got {type(ret)} instead."
                     )
             except WatchpointQuit:
                 logger.info("Watchpoint stopped.")
@@ -138,6 +220,66 @@ class Watchpoint:
         finally:
             logger.info("Watchpoint thread finished.")
 
+    def _dispatch_generator(self, gen: Iterator[bool]):
+        """
+        Runs the 'do' handler for every truthy value produced by `gen` until it
+        is exhausted or the watchpoint is stopped.
+
+        This is the hot loop in generator mode, so attribute lookups are
+        hoisted into locals.
+        """
+        if self._buffer_size:
+            self._dispatch_buffered(gen, self._buffer_size)
+            return
+
+        is_stopped = self._stop_event.is_set
+        execute = self._execute_do_handler
+        for result in gen:
+            if is_stopped():
+                break
+            if result:
+                execute()
+
+    def _dispatch_buffered(self, gen: Iterator[bool], size: int):
+        """
+        Like `_dispatch_generator`, but queues triggers for a pooled worker
+        thread that runs the 'do' handler. Waits for the worker to drain the queue.
+        """
+        pending: Deque[bool] = deque(maxlen=size)
+        ready = threading.Condition()
+        producing = True
+
+        def consume():
+            while True:
+                with ready:
+                    while not pending and producing:
+                        ready.wait()
+                    if not pending:
+                        return
+                    pending.popleft()
+                try:
+                    self._execute_do_handler()
+                except WatchpointQuit:
+                    logger.info("Watchpoint stopped.")
+                    self._stop_event.set()
+                    return
+
+        consumer = _worker_pool.submit(consume)
+        is_stopped = self._stop_event.is_set
+        try:
+            for result in gen:
+                if is_stopped():
+                    break
+                if result:
+                    with ready:
+                        pending.append(True)
+                        ready.notify()
+        finally:
+            with ready:
+                producing = False
+                ready.notify()
+            consumer.join()
+
     def _execute_do_handler(self):
         """Executes the 'do' handler and handles any potential errors."""
         logger.info("Condition met. Executing 'do' handler.")
@@ -148,23 +290,31 @@ class Watchpoint:
         except WatchpointQuit as e:  # propagate
             raise e
         except Exception as e:
-            logger.error(f"Error executing 'do' handler: {e}", exc_info=True)
+            logger.error("Error executing 'do' handler: %s", e, exc_info=True)
 
-    def start(self) -> "Watchpoint":
-        """Starts the Watchpoint monitor in a background thread."""
-        if self._thread and self._thread.is_alive():
-            logger.warning("Watchpoint is already running.")
-            return self
+    def _validate(self):
+        """Checks that the watchpoint is fully configured before it starts."""
         if not self._on_handler or not self._do_handler:
             raise WatchpointConfigurationError(
                 "Cannot start Watchpoint: 'on' and 'do' handlers must be configured."
             )
+
+    def start(self) -> "Watchpoint":
+        """
+        Starts the Watchpoint monitor in a background thread.
+
+        The monitor runs on a pooled worker thread, which is reused by later
+        starts once this run has finished.
+        """
+        if self._thread and self._thread.is_alive():
+            logger.warning("Watchpoint is already running.")
+            return self
+        if not self._validated:
+            self._validate()
+            self._validated = True
         logger.info("Starting Watchpoint...")
         self._stop_event.clear()
-        self._thread = threading.Thread(
-            target=self._run, daemon=True, name="WatchpointThread"
-        )
-        self._thread.start()
+        self._thread = _worker_pool.submit(self._run)
         return self
 
     def stop(self, timeout: Optional[float] = 10.0) -> "Watchpoint":
@@ -182,8 +332,9 @@ class Watchpoint:
 
             if self._thread.is_alive():
                 logger.error(
-                    f"Watchpoint thread did not stop within the {timeout}s timeout. "
-                    "The 'on_handler' may have a blocking operation or is not checking the stop_event."
+                    "Watchpoint thread did not stop within the %ss timeout. "
+                    "The 'on_handler' may have a blocking operation or is not checking the stop_event.",
+                    timeout,
                 )
         else:
             logger.debug("Watchpoint is not running or has already stopped.")
@@ -1,4 +1,8 @@
+import os
+import shutil
+import signal
 import socket
+import sys
 import threading
 import time
 from pathlib import Path
@@ -16,17 +20,84 @@ def stop_event():
     return threading.Event()
 
 
+@pytest.fixture(scope="session")
+def free_port_pool():
+    """
+    Reserves a batch of free TCP ports once per test session. The sockets are
+    held open together so the OS hands out distinct ports, then released.
+    """
+    sockets = []
+    try:
+        for _ in range(32):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sockets.append(s)
+            s.bind(("", 0))
+        return [s.getsockname()[1] for s in sockets]
+    finally:
+        for s in sockets:
+            s.close()
+
+
 @pytest.fixture
-def free_port():
+def free_port(free_port_pool):
     """
-    Finds and provides a free TCP port for network tests by binding to port 0
-    and letting the OS choose an available port. [8]
+    Provides a free TCP port for network tests, taken from the session pool.
+    Once the pool is used up, binds to port 0 and lets the OS choose an
+    available port. [8]
     """
+    if free_port_pool:
+        return free_port_pool.pop()
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("", 0))
         return s.getsockname()[1]
 
 
+# --- Helpers ---
+
+
+def _wait_until(predicate, timeout: float = 1.0, step: float = 0.001) -> bool:
+    """
+    Polls `predicate` every `step` seconds until it returns True, giving up
+    after `timeout` seconds. Returns whether the predicate was satisfied.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(step)
+    return True
+
+
+def _port_accepts(host: str, port: int) -> bool:
+    """Returns whether a TCP connection to `host:port` succeeds right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex((host, port)) == 0
+
+
+def _run_in_forked_child(func, timeout: float = 5.0) -> int:
+    """
+    Runs `func` in a forked child process. Returns 0 if it returned a truthy
+    value, 1 otherwise, or -1 if it had to be killed after `timeout` seconds.
+    """
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            code = 0 if func() else 1
+        finally:
+            os._exit(code)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        time.sleep(0.01)
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    return -1
+
+
 # --- Tests for Time-Based Conditions ---
 
 
@@ -60,6 +131,20 @@ def test_every_n_seconds(stop_event):
         next(handler)
 
 
+def test_every_n_seconds_condition(stop_event):
+    """
+    Tests that the `EveryNSeconds` class form returns True from `poll()` and
+    None once the stop_event is set.
+    """
+    condition = conditions.EveryNSeconds(0.01, stop_event)
+    assert isinstance(condition, conditions.Condition)
+    assert condition.poll() is True
+
+    stop_event.set()
+    assert condition.poll() is None
+    condition.close()
+
+
 # --- Tests for File System Conditions ---
 
 
@@ -92,6 +177,86 @@ def test_new_file_in_directory(tmp_path, stop_event):
         next(handler)
 
 
+def test_new_file_in_directory_detects_moved_in_file(tmp_path, stop_event):
+    """
+    Tests that a file renamed into the watched directory counts as new.
+    """
+    watched = tmp_path / "watched"
+    watched.mkdir()
+    staged = tmp_path / "staged.txt"
+    staged.touch()
+
+    check_interval = 0.01
+    handler = conditions.new_file_in_directory(watched, stop_event, check_interval)
+    assert next(handler) is False
+
+    staged.rename(watched / "staged.txt")
+    assert next(handler) is True
+    assert next(handler) is False
+
+
+def test_new_file_in_directory_polling_fallback(tmp_path, stop_event, monkeypatch):
+    """
+    Tests that `new_file_in_directory` still works when inotify is unavailable.
+    """
+    monkeypatch.setattr(conditions, "_inotify_watch", lambda *args: None)
+    check_interval = 0.01
+    handler = conditions.new_file_in_directory(tmp_path, stop_event, check_interval)
+
+    assert next(handler) is False
+    (tmp_path / "test_file.txt").touch()
+    assert next(handler) is True
+    assert next(handler) is False
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_new_file_in_directory_after_delete_and_rename(
+    tmp_path, stop_event, monkeypatch, use_inotify
+):
+    """
+    Tests that a file created right after another was deleted (which may reuse
+    its inode number) and a file renamed within the directory both count as
+    new, whichever backend is used.
+    """
+    if not use_inotify:
+        monkeypatch.setattr(conditions, "_inotify_watch", lambda *args: None)
+    (tmp_path / "a.csv").touch()
+    check_interval = 0.01
+    handler = conditions.new_file_in_directory(tmp_path, stop_event, check_interval)
+    assert next(handler) is False
+
+    (tmp_path / "a.csv").unlink()
+    (tmp_path / "b.csv").touch()
+    assert next(handler) is True
+    assert next(handler) is False
+
+    (tmp_path / "b.csv").rename(tmp_path / "c.csv")
+    assert next(handler) is True
+    assert next(handler) is False
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_new_file_in_directory_predicate(
+    tmp_path, stop_event, monkeypatch, use_inotify
+):
+    """
+    Tests that only entries accepted by `predicate` count as new files.
+    """
+    if not use_inotify:
+        monkeypatch.setattr(conditions, "_inotify_watch", lambda *args: None)
+    check_interval = 0.01
+    handler = conditions.new_file_in_directory(
+        tmp_path, stop_event, check_interval, predicate=lambda e: e.is_file()
+    )
+
+    (tmp_path / "subdir").mkdir()
+    assert next(handler) is False
+
+    (tmp_path / "test_file.txt").touch()
+    assert next(handler) is True
+    assert next(handler) is False
+
+
 def test_new_file_in_directory_non_existent(stop_event):
     """
     Tests that `new_file_in_directory` raises FileNotFoundError
@@ -141,6 +306,33 @@ def test_file_not_modified_for(tmp_path, stop_event):
         next(handler)
 
 
+def test_file_not_modified_for_follows_replaced_file(tmp_path, stop_event):
+    """
+    Tests that `file_not_modified_for` checks whatever file is currently at
+    the path, e.g. after a log file is rotated into place.
+    """
+    file_path = tmp_path / "logs" / "test.log"
+    file_path.parent.mkdir()
+    file_path.touch()
+    os.utime(file_path, (0, 0))
+
+    handler = conditions.file_not_modified_for(file_path, stop_event, 60, 0.01)
+    assert next(handler) is True
+
+    replacement = tmp_path / "fresh.log"
+    replacement.touch()
+    os.replace(replacement, file_path)
+    assert next(handler) is False
+
+    # Replacing the parent directory is picked up as well.
+    shutil.rmtree(file_path.parent)
+    assert next(handler) is False
+    file_path.parent.mkdir()
+    file_path.touch()
+    os.utime(file_path, (0, 0))
+    assert next(handler) is True
+
+
 def test_file_not_modified_for_non_existent_file(tmp_path, stop_event):
     """
     Tests that `file_not_modified_for` yields False for a non-existent file.
@@ -181,6 +373,153 @@ def test_file_exists(tmp_path, stop_event):
         next(handler)
 
 
+def test_file_exists_condition(tmp_path, stop_event):
+    """
+    Tests that the `FileExists` class form tracks the existence of a file.
+    """
+    file_path = tmp_path / "watched_file.txt"
+    condition = conditions.FileExists(file_path, stop_event, 0.01)
+    try:
+        assert condition.poll() is False
+        file_path.touch()
+        assert condition.poll() is True
+    finally:
+        condition.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="Requires symlinks.")
+def test_file_exists_follows_swapped_symlink(tmp_path, stop_event):
+    """
+    Tests that `file_exists` follows a parent symlink that is atomically
+    swapped to another directory (the `current -> release-N` deploy pattern).
+    """
+    (tmp_path / "release-1").mkdir()
+    (tmp_path / "release-1" / "ready").touch()
+    (tmp_path / "release-2").mkdir()
+    current = tmp_path / "current"
+    current.symlink_to(tmp_path / "release-1")
+
+    handler = conditions.file_exists(current / "ready", stop_event, 0.01)
+    assert next(handler) is True
+
+    staged = tmp_path / "current.new"
+    staged.symlink_to(tmp_path / "release-2")
+    os.replace(staged, current)
+    assert next(handler) is False
+
+
+def test_file_exists_stops_while_waiting(tmp_path, stop_event):
+    """
+    Tests that setting the stop_event releases a `file_exists` generator that
+    is waiting on the shared poller for its next check.
+    """
+    handler = conditions.file_exists(tmp_path / "watched_file.txt", stop_event, 60)
+    assert next(handler) is False
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(list(handler)))
+    waiter.start()
+    time.sleep(0.05)
+    stop_event.set()
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert results == [[]]
+
+
+def test_stop_while_check_runs_defers_release(stop_event):
+    """
+    Tests that stopping releases a caller whose check is already running on
+    the shared poller, and that the condition's resources are only released
+    once that check has finished.
+    """
+    check_started = threading.Event()
+    finish_check = threading.Event()
+    released = []
+
+    class BlockingCondition(conditions._PolledCondition):
+        def _check(self):
+            check_started.set()
+            finish_check.wait(5)
+            return True
+
+        def _release(self):
+            released.append(finish_check.is_set())
+
+    condition = BlockingCondition(stop_event, 60)
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(condition.poll()))
+    waiter.start()
+    assert check_started.wait(1)
+
+    stop_event.set()
+    waiter.join(timeout=1)
+    assert not waiter.is_alive()
+    assert results == [None]
+
+    condition.close()
+    assert released == []
+    finish_check.set()
+    assert _wait_until(lambda: released == [True])
+
+
+def test_system_exit_in_check_does_not_kill_poller(tmp_path, stop_event):
+    """
+    Tests that a BaseException raised by a user predicate reaches the caller
+    and leaves the shared poller running for other conditions.
+    """
+
+    def exiting_predicate(entry):
+        sys.exit(1)
+
+    handler = conditions.new_file_in_directory(
+        tmp_path, stop_event, 0.01, predicate=exiting_predicate
+    )
+    next(handler)
+    (tmp_path / "test_file.txt").touch()
+    with pytest.raises(SystemExit):
+        next(handler)
+
+    other = conditions.file_exists(tmp_path / "test_file.txt", threading.Event(), 0.01)
+    assert next(other) is True
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork().")
+def test_file_exists_in_forked_child(tmp_path, stop_event):
+    """
+    Tests that a forked child gets its own poller instead of the parent's,
+    whose thread does not exist in the child.
+    """
+    file_path = tmp_path / "watched_file.txt"
+    file_path.touch()
+    assert next(conditions.file_exists(file_path, stop_event, 0.01)) is True
+
+    def child():
+        return next(conditions.file_exists(file_path, threading.Event(), 0.01))
+
+    assert _run_in_forked_child(child) == 0
+
+
+def test_clear_stat_cache(tmp_path, stop_event):
+    """
+    Tests that a cached "missing file" result is served until the cache is
+    cleared.
+    """
+    file_path = tmp_path / "watched_file.txt"
+    handler = conditions.file_exists(file_path, stop_event, 60)
+    other = conditions.file_exists(file_path, stop_event, 60)
+
+    assert next(handler) is False
+    file_path.touch()
+    # The second watcher reuses the negative result cached by the first.
+    assert next(other) is False
+
+    conditions.clear_stat_cache(file_path)
+    assert next(conditions.file_exists(file_path, stop_event, 60)) is True
+
+    conditions.clear_stat_cache()
+
+
 # --- Tests for Network Conditions ---
 
 
@@ -215,7 +554,7 @@ def test_is_port_open(stop_event, free_port):
     st = threading.Thread(target=server_thread, daemon=True)
     st.start()
 
-    time.sleep(1.0)  # Give the server thread a moment to start listening
+    assert _wait_until(lambda: _port_accepts(host, port))
 
     # Now the port should be detected as open, yielding True
     assert next(handler) is True
@@ -224,7 +563,7 @@ def test_is_port_open(stop_event, free_port):
     server_socket.close()
     st.join()
 
-    time.sleep(1.0)  # Give the OS a moment to register the port as closed
+    assert _wait_until(lambda: not _port_accepts(host, port))
 
     # Now the port should be detected as closed again, yielding False
     assert next(handler) is False
@@ -233,3 +572,121 @@ def test_is_port_open(stop_event, free_port):
     stop_event.set()
     with pytest.raises(StopIteration):
         next(handler)
+
+
+def test_is_port_open_reuse_connection(stop_event, free_port):
+    """
+    Tests that with `reuse_connection` a held connection keeps reporting the
+    port as open, and that closing the port is detected.
+    """
+    host = "127.0.0.1"
+    port = free_port
+    handler = conditions.is_port_open(
+        host, port, stop_event, 0.01, reuse_connection=True
+    )
+
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind((host, port))
+    server_socket.listen(1)
+
+    assert next(handler) is True
+    conn, _ = server_socket.accept()
+
+    # The held connection is read from; no new connection is made.
+    server_socket.settimeout(0.05)
+    assert next(handler) is True
+    assert next(handler) is True
+    with pytest.raises(socket.timeout):
+        server_socket.accept()
+
+    conn.close()
+    server_socket.close()
+    assert next(handler) is False
+
+    stop_event.set()
+    with pytest.raises(StopIteration):
+        next(handler)
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "TCP_KEEPIDLE"), reason="Requires TCP keepalive tuning."
+)
+def test_is_port_open_reuse_connection_keepalive(stop_event, free_port):
+    """
+    Tests that a held connection probes a silent peer on the check interval
+    and timeout instead of the OS keepalive defaults.
+    """
+    host = "127.0.0.1"
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind((host, free_port))
+        server_socket.listen(1)
+        condition = conditions.IsPortOpen(
+            host, free_port, stop_event, 30.0, 2.5, reuse_connection=True
+        )
+        try:
+            assert condition.poll() is True
+            sock = condition._sock
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL) == 3
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 3
+        finally:
+            condition.close()
+
+
+def test_is_port_open_reuse_connection_after_greeting(stop_event, free_port):
+    """
+    Tests that data sent by the server (e.g. a banner) does not keep a closed
+    port reported as open when `reuse_connection` is used.
+    """
+    host = "127.0.0.1"
+    port = free_port
+    handler = conditions.is_port_open(
+        host, port, stop_event, 0.01, reuse_connection=True
+    )
+
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind((host, port))
+    server_socket.listen(1)
+
+    assert next(handler) is True
+    conn, _ = server_socket.accept()
+    conn.sendall(b"220 service ready\r\n")
+    assert next(handler) is True
+
+    conn.close()
+    server_socket.close()
+    assert _wait_until(lambda: not _port_accepts(host, port))
+    assert next(handler) is False
+    assert next(handler) is False
+
+
+def test_is_port_open_with_high_file_descriptors(stop_event, free_port):
+    """
+    Tests that `is_port_open` works when socket descriptors exceed
+    FD_SETSIZE, as happens in long-running service processes.
+    """
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < 1100 and (hard != resource.RLIM_INFINITY and hard < 1100):
+        pytest.skip("Cannot open enough file descriptors.")
+    if soft < 1100:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (1100, hard))
+
+    fds = []
+    try:
+        with open(os.devnull) as f:
+            while not fds or fds[-1] < 1050:
+                fds.append(os.dup(f.fileno()))
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+            server_socket.bind(("127.0.0.1", free_port))
+            server_socket.listen(1)
+            handler = conditions.is_port_open("127.0.0.1", free_port, stop_event, 0.01)
+            assert next(handler) is True
+    finally:
+        for fd in fds:
+            os.close(fd)
+        if soft < 1100:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
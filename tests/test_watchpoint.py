@@ -1,4 +1,9 @@
+import collections
+import inspect
 import logging
+import os
+import signal
+import sys
 import threading
 import time
 from functools import partial
@@ -10,15 +15,16 @@ from watchpoint import (
     Watchpoint,
     WatchpointConfigurationError,
     WatchpointQuit,
+    conditions,
     on,
     watch,
 )
 
 # --- Test Setup and Helper Handlers ---
 
-# A shared list to track calls from the 'do' handler across threads
+# A shared deque to track calls from the 'do' handler across threads
 # This is a simple way to verify if and how many times an action was executed.
-call_tracker = []
+call_tracker = collections.deque()
 
 
 def on_returns_true() -> bool:
@@ -32,7 +38,7 @@ def on_returns_false() -> bool:
 
 
 def do_action_marker(marker: str = "called"):
-    """A 'do' handler that appends a marker to the global tracker list."""
+    """A 'do' handler that appends a marker to the global tracker."""
     call_tracker.append(marker)
 
 
@@ -49,12 +55,15 @@ def on_generator(
     A generator 'on' handler that yields `True` a specific number of times.
     It respects the stop_event to allow for clean shutdown.
     """
-    time.sleep(initial_delay)  # Allow time for the test to start the watchpoint
+    # Allow time for the test to start the watchpoint
+    if stop_event.wait(initial_delay):
+        return
     count = 0
     while count < yields and not stop_event.is_set():
         yield True
         count += 1
-        time.sleep(0.02)  # Simulate work/delay between yields
+        # Simulate work/delay between yields, waking immediately on stop()
+        stop_event.wait(0.02)
 
 
 def on_generator_with_false_yields(
@@ -66,7 +75,7 @@ def on_generator_with_false_yields(
         if stop_event.is_set():
             break
         yield y
-        time.sleep(0.02)
+        stop_event.wait(0.02)
 
 
 def on_handler_with_invalid_return():
@@ -78,7 +87,7 @@ def on_handler_with_invalid_return():
 def reset_call_tracker():
     """
     A pytest fixture that automatically runs before each test.
-    It clears the global call_tracker list to ensure tests are isolated.
+    It clears the global call_tracker to ensure tests are isolated.
     """
     call_tracker.clear()
 
@@ -126,6 +135,17 @@ class TestWatchpointConfiguration:
         with pytest.raises(WatchpointConfigurationError, match="must be configured"):
             watchpoint.start()
 
+    def test_start_after_completing_configuration(self):
+        """A failed start does not prevent starting once configuration is complete."""
+        watchpoint = Watchpoint().on(on_returns_true)
+        with pytest.raises(WatchpointConfigurationError, match="must be configured"):
+            watchpoint.start()
+
+        watchpoint.do(do_action_marker).start()
+        watchpoint.stop()
+
+        assert list(call_tracker) == ["called"]
+
 
 class TestWatchpointOneShotMode:
     """Tests for the one-shot (boolean return) execution mode."""
@@ -136,7 +156,7 @@ class TestWatchpointOneShotMode:
         watchpoint.start()
         time.sleep(1.0)  # Allow thread time to execute
 
-        assert call_tracker == ["called"]
+        assert list(call_tracker) == ["called"]
         # The thread should be finished after a one-shot execution
         assert watchpoint._thread is not None and not watchpoint._thread.is_alive()
 
@@ -157,7 +177,42 @@ class TestWatchpointOneShotMode:
         watchpoint.start()
         time.sleep(1.0)
 
-        assert call_tracker == ["custom"]
+        assert list(call_tracker) == ["custom"]
+
+    def test_handlers_with_positional_and_arbitrary_keyword_arguments(self):
+        """Ensures positional and non-identifier keyword arguments are passed."""
+
+        def do_record(*args, **kwargs):
+            call_tracker.append((args, kwargs))
+
+        watchpoint = (
+            Watchpoint()
+            .on(on_returns_true)
+            .do(do_record, "a", 1, marker="custom", **{"not-an-identifier": 2})
+        )
+        watchpoint.start()
+        watchpoint.stop()
+
+        assert list(call_tracker) == [
+            (("a", 1), {"marker": "custom", "not-an-identifier": 2})
+        ]
+
+    def test_do_handler_with_bound_arguments_takes_no_arguments(self):
+        """The bound 'do' handler is a zero-argument callable."""
+        watchpoint = Watchpoint().do(do_action_marker, marker="custom")
+        assert not inspect.signature(watchpoint._do_handler).parameters
+
+    def test_handlers_with_debug_keyword_argument(self):
+        """`__debug__` can be bound as a keyword even though it is reserved."""
+
+        def do_record(**kwargs):
+            call_tracker.append(kwargs)
+
+        watchpoint = Watchpoint().on(on_returns_true).do(do_record, **{"__debug__": 1})
+        watchpoint.start()
+        watchpoint.stop()
+
+        assert list(call_tracker) == [{"__debug__": 1}]
 
     def test_do_action_once(self):
         """Ensures the do_handler is called once and exits gracefully"""
@@ -165,7 +220,7 @@ class TestWatchpointOneShotMode:
         watchpoint.start()
         time.sleep(1.0)
 
-        assert call_tracker == ["called"]
+        assert list(call_tracker) == ["called"]
         assert watchpoint._thread is not None and not watchpoint._thread.is_alive()
 
 
@@ -208,6 +263,102 @@ class TestWatchpointGeneratorMode:
         assert len(call_tracker) == 3
 
 
+class TestWatchpointConditionMode:
+    """Tests for 'on' handlers that return a `conditions.Condition`."""
+
+    def test_condition_triggers_do_handler_multiple_times(self):
+        """Verifies the do_handler is called for each truthy `poll()` result."""
+        watchpoint = on(conditions.EveryNSeconds, seconds=0.01).do(do_action_marker)
+        watchpoint.start()
+        time.sleep(0.2)
+        watchpoint.stop()
+
+        assert len(call_tracker) > 1
+        assert not watchpoint._thread.is_alive()
+
+    def test_condition_is_closed_when_stopped(self):
+        """The Watchpoint closes the condition once it stops polling it."""
+
+        class CountingCondition(conditions.Condition):
+            def __init__(self, stop_event):
+                self.stop_event = stop_event
+
+            def poll(self):
+                return None if self.stop_event.wait(0.01) else True
+
+            def close(self):
+                call_tracker.append("closed")
+
+        watchpoint = Watchpoint().on(CountingCondition).do(do_action_marker)
+        watchpoint.start()
+        time.sleep(0.1)
+        watchpoint.stop()
+
+        assert call_tracker[-1] == "closed"
+        assert call_tracker.count("closed") == 1
+
+
+class TestWatchpointBufferedMode:
+    """Tests for dispatching the 'do' handler through a buffer."""
+
+    def test_buffered_generator_triggers_do_handler_multiple_times(self):
+        """Verifies every queued trigger is executed by the worker thread."""
+        watchpoint = (
+            Watchpoint().on(on_generator, yields=4).do(do_action_marker).buffered()
+        )
+        watchpoint.start()
+        time.sleep(0.2)
+        watchpoint.stop()
+
+        assert len(call_tracker) == 4
+        assert watchpoint._thread is not None and not watchpoint._thread.is_alive()
+
+    def test_buffered_drains_pending_triggers_on_stop(self):
+        """Triggers queued behind a slow 'do' handler still run on stop()."""
+
+        def slow_do_handler():
+            time.sleep(0.05)
+            call_tracker.append("called")
+
+        watchpoint = Watchpoint().on(on_generator, yields=3).do(slow_do_handler)
+        watchpoint.buffered(size=8).start()
+        time.sleep(0.07)
+        watchpoint.stop()
+
+        assert len(call_tracker) == 3
+
+    def test_buffered_do_action_once(self):
+        """A WatchpointQuit from the worker thread stops the watchpoint."""
+        watchpoint = (
+            Watchpoint().on(on_generator, yields=200).do(do_action_once).buffered()
+        )
+        watchpoint.start()
+        time.sleep(0.2)
+
+        assert list(call_tracker) == ["called"]
+        assert not watchpoint._thread.is_alive()
+
+    def test_buffered_consumer_reuses_worker_thread(self):
+        """The buffered 'do' worker comes from the pool and is reused."""
+
+        def do_record_thread():
+            call_tracker.append(threading.current_thread())
+
+        watchpoint = Watchpoint().on(on_generator, yields=1).do(do_record_thread)
+        watchpoint.buffered()
+        for _ in range(2):
+            with watchpoint:
+                watchpoint._thread.join(timeout=1)
+
+        assert len(call_tracker) == 2
+        assert call_tracker[0] is call_tracker[1]
+
+    def test_buffered_invalid_size_raises_error(self):
+        """A buffer must hold at least one trigger."""
+        with pytest.raises(WatchpointConfigurationError, match="buffer size"):
+            Watchpoint().buffered(size=0)
+
+
 class TestWatchpointErrorHandling:
     """Tests for robust error handling within the Watchpoint thread."""
 
@@ -270,6 +421,20 @@ class TestWatchpointErrorHandling:
             assert caplog.text.count("Error executing 'do' handler") == 3
             assert "Something went wrong in the action!" in caplog.text
 
+    def test_do_handler_traceback_is_logged(self, caplog):
+        """The traceback of a failing 'do' handler is included in the error log."""
+
+        def faulty_do_handler():
+            raise ValueError("Something went wrong in the action!")
+
+        with caplog.at_level(logging.INFO):
+            watchpoint = Watchpoint().on(on_returns_true).do(faulty_do_handler)
+            watchpoint.start()
+            watchpoint.stop()
+
+        assert "Error executing 'do' handler" in caplog.text
+        assert "Traceback" in caplog.text
+
 
 class TestWatchpointContextManager:
     """Tests for the context manager (__enter__/__exit__) protocol."""
@@ -295,11 +460,11 @@ class TestWatchpointContextManager:
             time.sleep(1.0)  # Give thread time to execute
             # The thread is likely already finished, which is correct for one-shot
             assert not watchpoint._thread.is_alive()
-            assert call_tracker == ["called"]
+            assert list(call_tracker) == ["called"]
 
         # Double-check state after exiting
         assert not watchpoint._thread.is_alive()
-        assert call_tracker == ["called"]
+        assert list(call_tracker) == ["called"]
 
     def test_generator_handler_in_context_manager(self):
         """Verifies a generator is active inside `with` and stops on exit."""
@@ -326,6 +491,68 @@ class TestWatchpointContextManager:
         assert not watchpoint._thread.is_alive()
         assert len(call_tracker) > 0  # It had time to run at least once
 
+    def test_restart_reuses_worker_thread(self):
+        """Re-entering a watchpoint runs it on the pooled worker from the last run."""
+
+        def do_record_thread():
+            call_tracker.append(threading.current_thread())
+
+        watchpoint = on(on_returns_true).do(do_record_thread)
+        for _ in range(2):
+            with watchpoint:
+                watchpoint._thread.join(timeout=1)
+
+        assert len(call_tracker) == 2
+        assert call_tracker[0] is call_tracker[1]
+
+    def test_system_exit_does_not_break_later_watchpoints(self):
+        """A handler calling sys.exit() must not leave a dead worker in the pool."""
+
+        def do_exit():
+            sys.exit(1)
+
+        exiting = Watchpoint().on(on_returns_true).do(do_exit).start()
+        exiting._thread.join(timeout=1)
+        assert not exiting._thread.is_alive()
+
+        watchpoint = Watchpoint().on(on_returns_true).do(do_action_marker).start()
+        watchpoint._thread.join(timeout=1)
+
+        assert not watchpoint._thread.is_alive()
+        assert list(call_tracker) == ["called"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork().")
+    def test_start_in_forked_child(self):
+        """A forked child must not hand its watchpoint to the parent's workers."""
+        # Park a worker in the parent so the child inherits a non-empty pool.
+        watchpoint = Watchpoint().on(on_returns_true).do(do_action_marker).start()
+        watchpoint._thread.join(timeout=1)
+        assert list(call_tracker) == ["called"]
+
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                call_tracker.clear()
+                child = Watchpoint().on(on_returns_true).do(do_action_marker).start()
+                child._thread.join(timeout=1)
+                if list(call_tracker) == ["called"] and not child._thread.is_alive():
+                    code = 0
+            finally:
+                os._exit(code)
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            time.sleep(0.01)
+        else:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            pytest.fail("Forked child did not finish.")
+        assert os.waitstatus_to_exitcode(status) == 0
+
     def test_context_manager_raises_config_error(self):
         """
         Checks that entering a `with` block with an incomplete configuration